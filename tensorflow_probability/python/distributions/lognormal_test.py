@@ -18,6 +18,8 @@ from __future__ import absolute_import
 from __future__ import division
 from __future__ import print_function
 
+import math
+
 # Dependency imports
 
 import numpy as np
@@ -28,6 +30,9 @@ from tensorflow_probability.python.internal import test_util as tfp_test_util
 from tensorflow.python.framework import test_util  # pylint: disable=g-direct-tensorflow-import
 
 
+_LOG_SQRT_2PI = 0.5 * math.log(2. * math.pi)
+
+
 @test_util.run_all_in_graph_and_eager_modes
 class LogNormalTest(tfp_test_util.TestCase):
 
@@ -40,16 +45,16 @@ class LogNormalTest(tfp_test_util.TestCase):
     scale = np.float32([0.4, 1.1])
     dist = tfd.LogNormal(loc=loc, scale=scale)
 
-    self.assertAllClose(self.evaluate(dist.mean()),
-                        np.exp(loc + scale**2 / 2))
-    self.assertAllClose(self.evaluate(dist.variance()),
+    mean_, variance_, stddev_, mode_, entropy_ = self.evaluate([
+        dist.mean(), dist.variance(), dist.stddev(), dist.mode(),
+        dist.entropy()])
+
+    self.assertAllClose(mean_, np.exp(loc + scale**2 / 2))
+    self.assertAllClose(variance_,
                         (np.exp(scale**2) - 1) * np.exp(2 * loc + scale**2))
-    self.assertAllClose(self.evaluate(dist.stddev()),
-                        np.sqrt(self.evaluate(dist.variance())))
-    self.assertAllClose(self.evaluate(dist.mode()),
-                        np.exp(loc - scale**2))
-    self.assertAllClose(self.evaluate(dist.entropy()),
-                        np.log(scale * np.exp(loc + 0.5) * np.sqrt(2 * np.pi)))
+    self.assertAllClose(stddev_, np.sqrt(variance_))
+    self.assertAllClose(mode_, np.exp(loc - scale**2))
+    self.assertAllClose(entropy_, np.log(scale) + loc + 0.5 + _LOG_SQRT_2PI)
 
   def testLogNormalSample(self):
     loc, scale = 1.5, 0.4
@@ -69,8 +74,9 @@ class LogNormalTest(tfp_test_util.TestCase):
     x = np.array([1e-4, 1.0, 2.0], dtype=np.float32)
 
     log_pdf = dist.log_prob(x)
-    analytical_log_pdf = -np.log(x * scale * np.sqrt(2 * np.pi)) - (
-        np.log(x) - loc)**2 / (2. * scale**2)
+    log_x = np.log(x)
+    analytical_log_pdf = (-_LOG_SQRT_2PI - log_x - np.log(scale) -
+                          0.5 * ((log_x - loc) / scale)**2)
 
     self.assertAllClose(self.evaluate(log_pdf), analytical_log_pdf)
 
@@ -106,15 +112,17 @@ class LogNormalTest(tfp_test_util.TestCase):
     kl_expected_from_formula = ((mu_a - mu_b)**2 / (2 * sigma_b**2) + 0.5 * (
         (sigma_a**2 / sigma_b**2) - 1 - 2 * np.log(sigma_a / sigma_b)))
 
-    x = ln_a.sample(int(1e5), seed=tfp_test_util.test_seed())
-    kl_sample = tf.reduce_mean(ln_a.log_prob(x) - ln_b.log_prob(x), axis=0)
+    # KL(a || b) = E_a[log a] - E_a[log b]; estimate the two terms separately.
+    x = ln_a.sample(int(1e4), seed=tfp_test_util.test_seed())
+    kl_sample = (tf.reduce_mean(ln_a.log_prob(x), axis=0) -
+                 tf.reduce_mean(ln_b.log_prob(x), axis=0))
     kl_sample_ = self.evaluate(kl_sample)
 
     self.assertEqual(kl.shape, (batch_size,))
     self.assertAllClose(kl_val, kl_expected_from_normal)
     self.assertAllClose(kl_val, kl_expected_from_formula)
     self.assertAllClose(
-        kl_expected_from_formula, kl_sample_, atol=0.0, rtol=1e-2)
+        kl_expected_from_formula, kl_sample_, atol=0.0, rtol=6e-2)
 
 
 if __name__ == '__main__':
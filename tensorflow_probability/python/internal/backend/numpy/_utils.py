@@ -48,12 +48,23 @@ def copy_docstring(original_fn, new_fn):  # pylint: disable=unused-argument
   # return wrap(original_fn)
 
 
+_NUMPY_DTYPE_CACHE = {}
+
+
 def numpy_dtype(dtype):
+  """Returns the numpy dtype corresponding to `dtype`, memoized."""
   if dtype is None:
     return None
-  if hasattr(dtype, 'as_numpy_dtype'):
-    return dtype.as_numpy_dtype
-  return dtype
+  try:
+    return _NUMPY_DTYPE_CACHE[dtype]
+  except (KeyError, TypeError):  # TypeError: `dtype` is not hashable.
+    pass
+  np_dtype = dtype.as_numpy_dtype if hasattr(dtype, 'as_numpy_dtype') else dtype
+  try:
+    _NUMPY_DTYPE_CACHE[dtype] = np_dtype
+  except TypeError:
+    pass
+  return np_dtype
 
 
 def common_dtype(args_list, dtype_hint=None):
@@ -68,7 +68,55 @@ __all__ = [
 ]
 
 
-# TODO(b/136555907): Add unit-test.
+JAX_MODE = False
+
+
+builtin_range = range  # pylint: disable=invalid-name
+builtin_slice = slice  # pylint: disable=invalid-name
+
+
+# Dtypes `tf.range` supports, in increasing order of promotion.
+_RANGE_DTYPES = (np.int32, np.int64, np.float32, np.float64)
+
+
+def _infer_dtype(value):
+  """Returns the dtype TF infers for `value`."""
+  # Check numpy values first, since e.g. `np.float64` subclasses `float`.
+  if isinstance(value, (np.ndarray, np.generic)):
+    return np.dtype(value.dtype)
+  # Python scalars convert to TF's 32-bit defaults rather than numpy's.
+  if isinstance(value, bool):
+    return np.dtype(np.bool_)
+  if isinstance(value, int):
+    return np.dtype(np.int32)
+  if isinstance(value, float):
+    return np.dtype(np.float32)
+  if isinstance(value, complex):
+    return np.dtype(np.complex128)
+  return np.dtype(np.asarray(value).dtype)
+
+
+_PAD_MODE = {
+    'CONSTANT': 'constant',
+    'REFLECT': 'reflect',
+    'SYMMETRIC': 'symmetric',
+    'constant': 'constant',
+    'reflect': 'reflect',
+    'symmetric': 'symmetric',
+}
+
+
+def _concat(values, axis, name='concat'):  # pylint: disable=unused-argument
+  # Exact type check (not `isinstance`) keeps the common all-ndarray path cheap.
+  if all(type(v) is np.ndarray for v in values):  # pylint: disable=unidiomatic-typecheck
+    return np.concatenate(values, axis)
+  # Without a dtype, `convert_to_tensor` differs from `np.asarray` only for
+  # `TensorShape`s, so reserve the heavier path for those.
+  return np.concatenate([
+      ops.convert_to_tensor(v) if isinstance(v, ops.TensorShape)
+      else np.asarray(v) for v in values], axis)
+
+
 def _gather(  # pylint: disable=unused-argument
     params,
     indices,
@@ -83,7 +131,13 @@ def _gather(  # pylint: disable=unused-argument
   if batch_dims != 0:
     raise NotImplementedError(
         'Argument `batch_dims != 0` is currently unimplemented.')
-  return np.take(params, indices, axis=axis)
+  if not isinstance(indices, np.ndarray):
+    indices = np.asarray(indices, dtype=np.intp)
+  if not isinstance(params, np.ndarray):
+    params = np.asarray(params)
+  # Like `tf.gather`, `axis=None` means the leading axis (not the flattened
+  # array, as in `np.take`).
+  return params.take(indices, axis=0 if axis is None else axis)
 
 
 def _gather_nd(  # pylint: disable=unused-argument
@@ -95,6 +149,21 @@ def _gather_nd(  # pylint: disable=unused-argument
   raise NotImplementedError
 
 
+def _meshgrid(*args, **kwargs):
+  """meshgrid."""
+  indexing = kwargs.pop('indexing', 'xy')
+  sparse = kwargs.pop('sparse', False)
+  kwargs.pop('name', None)
+  if kwargs:
+    raise TypeError('Unexpected keyword arguments: {}'.format(list(kwargs)))
+  if JAX_MODE:
+    # `jax.numpy.meshgrid` only supports `copy=True`.
+    return np.meshgrid(*args, indexing=indexing, sparse=sparse)
+  # Tensors are immutable, so broadcast views (`copy=False`) are safe and avoid
+  # materializing every grid.
+  return np.meshgrid(*args, indexing=indexing, sparse=sparse, copy=False)
+
+
 def _one_hot(  # pylint: disable=unused-argument
     indices,
     depth,
@@ -104,17 +173,36 @@ def _one_hot(  # pylint: disable=unused-argument
     dtype=None,
     name=None):
   """One hot."""
+  if dtype is None:
+    # Like `tf.one_hot`, infer from `on_value` (else `off_value`) only when
+    # given, with Python scalars mapping to TF's 32-bit defaults.
+    if on_value is not None:
+      dtype = _infer_dtype(on_value)
+    elif off_value is not None:
+      dtype = _infer_dtype(off_value)
+    else:
+      dtype = np.float32
+  dtype = utils.numpy_dtype(dtype)
   if on_value is None:
     on_value = 1
   if off_value is None:
     off_value = 0
 
-  zeros = np.zeros_like(indices)  # pylint: disable=redefined-outer-name
-  zeros = np.tile(zeros[..., None], [1] * indices.ndim + [int(depth)])
-
-  cond = np.abs(np.arange(depth, dtype=np.float32) - indices[..., None]) < 0.1
-
-  y_out = np.where(cond, zeros + on_value, zeros + off_value)
+  indices = np.asarray(indices)
+  if JAX_MODE:
+    # JAX arrays are immutable, so select rather than scatter.
+    cond = indices[..., None] == np.arange(int(depth))
+    y_out = np.where(cond, on_value, off_value).astype(dtype)
+  else:
+    if np.issubdtype(indices.dtype, np.integer):
+      # Compare in `intp` so narrow index dtypes cannot overflow for large
+      # `depth`.
+      indices = indices.astype(np.intp, copy=False)
+    cond = indices[..., None] == np.arange(int(depth), dtype=np.intp)
+    # Write `off_value` once and scatter `on_value`, rather than materializing
+    # two broadcast operands for a select.
+    y_out = np.full(cond.shape, off_value, dtype)
+    np.putmask(y_out, cond, on_value)
 
   if axis is not None:
     y_out = np.moveaxis(y_out, -1, axis)
@@ -123,6 +211,8 @@ def _one_hot(  # pylint: disable=unused-argument
 
 
 def _ones_like(input, dtype=None, name=None):  # pylint: disable=redefined-builtin
+  if isinstance(input, (np.ndarray, np.generic)):
+    return np.ones_like(input, dtype=utils.numpy_dtype(dtype))
   s = _shape(input)
   if isinstance(s, (np.ndarray, np.generic)):
     return np.ones(s, utils.numpy_dtype(dtype or input.dtype))
@@ -138,16 +228,44 @@ def _pad(  # pylint: disable=unused-argument
     name=None):
   return np.pad(
       tensor, paddings,
-      mode=mode.lower(),
+      mode=_PAD_MODE.get(mode) or mode.lower(),
       constant_values=constant_values)
 
 
+def _range(start, limit=None, delta=1, dtype=None, name='range'):  # pylint: disable=unused-argument
+  """Emulates tf.range."""
+  if dtype is None:
+    # Infer from every argument, as TF does: `np.arange` steps in the target
+    # dtype, so e.g. an integer dtype with a float `delta` would never advance.
+    dtypes = [_infer_dtype(arg) for arg in (start, limit, delta)
+              if arg is not None]
+    unsupported = [dt for dt in dtypes if dt not in _RANGE_DTYPES]
+    if unsupported:
+      raise TypeError('Unsupported `range` dtype: {}.'.format(unsupported[0]))
+    dtype = max(dtypes, key=lambda dt: _RANGE_DTYPES.index(dt))
+  return np.arange(start, limit, delta, dtype=utils.numpy_dtype(dtype))
+
+
 def _reverse(tensor, axis, name=None):  # pylint: disable=unused-argument
-  if np.array(axis).ndim == 0:
-    return np.flip(tensor, axis)
-  for ax in axis:
-    tensor = np.flip(tensor, ax)
-  return tensor
+  if isinstance(axis, (int, np.integer)):
+    return np.flip(tensor, int(axis))
+  tensor = np.asarray(tensor)
+  rank = tensor.ndim
+  axes = set()
+  # `np.atleast_1d` also covers 0-d array `axis`.
+  for ax in np.atleast_1d(axis).tolist():
+    ax = int(ax)
+    if not -rank <= ax < rank:
+      raise ValueError(
+          'Argument `axis` ({}) is out of range for a rank {} tensor.'.format(
+              ax, rank))
+    if ax % rank in axes:
+      raise ValueError('Argument `axis` contains repeated axis {}.'.format(ax))
+    axes.add(ax % rank)
+  # Reverse all axes with a single negative-stride view.
+  return tensor[tuple(
+      builtin_slice(None, None, -1) if i in axes else builtin_slice(None)
+      for i in builtin_range(rank))]
 
 
 def _searchsorted(  # pylint: disable=unused-argument
@@ -160,15 +278,21 @@ def _searchsorted(  # pylint: disable=unused-argument
       sorted_sequence, values, side=side, sorter=None).astype(out_type)
 
 
-def _shape(input, out_type=tf.int32, name=None):  # pylint: disable=redefined-builtin,unused-argument
-  return np.array(np.array(input).shape).astype(utils.numpy_dtype(out_type))
+def _static_shape(input):  # pylint: disable=redefined-builtin
+  # Read `shape` off array-likes directly; only Python scalars and lists need
+  # to be converted.
+  if hasattr(input, 'shape'):
+    return input.shape
+  return np.asarray(input).shape
 
 
-def _size(input, out_type=tf.int32, name=None):  # pylint: disable=redefined-builtin, unused-argument
-  return np.prod(np.array(input).shape).astype(utils.numpy_dtype(out_type))
+def _shape(input, out_type=tf.int32, name=None):  # pylint: disable=redefined-builtin,unused-argument
+  return np.asarray(_static_shape(input), dtype=utils.numpy_dtype(out_type))
 
 
-builtin_slice = slice  # pylint: disable=invalid-name
+def _size(input, out_type=tf.int32, name=None):  # pylint: disable=redefined-builtin, unused-argument
+  return np.asarray(
+      int(np.prod(_static_shape(input))), dtype=utils.numpy_dtype(out_type))
 
 
 def _slice(input_, begin, size, name=None):  # pylint: disable=unused-argument,redefined-outer-name
@@ -179,6 +303,10 @@ def _slice(input_, begin, size, name=None):  # pylint: disable=unused-argument,r
 
 def _split(value, num_or_size_splits, axis=0, num=None, name='split'):  # pylint: disable=unused-argument
   """Map tf.split -> np.split."""
+  if isinstance(num_or_size_splits, (int, np.integer)):
+    # Like `tf.split`, `np.split` (unlike `np.array_split`) raises when the
+    # axis does not divide evenly.
+    return np.split(value, int(num_or_size_splits), axis)
   indices_or_sections = np.array(num_or_size_splits)
   if indices_or_sections.ndim == 1:
     if any(idx == -1 for idx in indices_or_sections):
@@ -194,10 +322,23 @@ def _split(value, num_or_size_splits, axis=0, num=None, name='split'):  # pylint
 
 def _transpose(a, perm=None, conjugate=False, name='transpose'):  # pylint: disable=unused-argument
   x = np.transpose(a, perm)
-  return np.conjugate(x) if conjugate else x
+  # Conjugating a real array is a no-op copy; return the transposed view.
+  return np.conjugate(x) if conjugate and utils.is_complex(x.dtype) else x
+
+
+def _unstack(value, num=None, axis=0, name='unstack'):  # pylint: disable=unused-argument
+  # Each element of the leading axis is a zero-copy view; no squeeze needed.
+  value = np.moveaxis(np.asarray(value), axis, 0)
+  if num is not None and num != value.shape[0]:
+    raise ValueError(
+        'Argument `num` ({}) must equal the size of dimension `axis` '
+        '({}).'.format(num, value.shape[0]))
+  return tuple(value[i] for i in builtin_range(value.shape[0]))
 
 
 def _zeros_like(input, dtype=None, name=None):  # pylint: disable=redefined-builtin
+  if isinstance(input, (np.ndarray, np.generic)):
+    return np.zeros_like(input, dtype=utils.numpy_dtype(dtype))
   s = _shape(input)
   if isinstance(s, (np.ndarray, np.generic)):
     return np.zeros(s, utils.numpy_dtype(dtype or input.dtype))
@@ -209,8 +350,7 @@ def _zeros_like(input, dtype=None, name=None):  # pylint: disable=redefined-buil
 
 concat = utils.copy_docstring(
     tf.concat,
-    lambda values, axis, name='concat': (  # pylint: disable=g-long-lambda
-        np.concatenate([ops.convert_to_tensor(v) for v in values], axis)))
+    _concat)
 
 expand_dims = utils.copy_docstring(
     tf.expand_dims,
@@ -218,7 +358,8 @@ expand_dims = utils.copy_docstring(
 
 fill = utils.copy_docstring(
     tf.fill,
-    lambda dims, value, name=None: value * np.ones(dims, np.array(value).dtype))
+    lambda dims, value, name=None: np.full(  # pylint: disable=g-long-lambda
+        dims, value, dtype=np.asarray(value).dtype))
 
 gather = utils.copy_docstring(
     tf.gather,
@@ -233,11 +374,11 @@ reverse = utils.copy_docstring(tf.reverse, _reverse)
 linspace = utils.copy_docstring(
     tf.linspace,
     lambda start, stop, num, name=None: (  # pylint: disable=g-long-lambda
-        np.linspace(start, stop, num).astype(np.array(start).dtype)))
+        np.linspace(start, stop, num, dtype=np.asarray(start).dtype)))
 
 meshgrid = utils.copy_docstring(
     tf.meshgrid,
-    np.meshgrid)
+    _meshgrid)
 
 norm = utils.copy_docstring(
     tf.norm,
@@ -262,13 +403,12 @@ pad = utils.copy_docstring(
 
 range = utils.copy_docstring(  # pylint: disable=redefined-builtin
     tf.range,
-    lambda start, limit=None, delta=1, dtype=None, name='range': np.arange(  # pylint: disable=g-long-lambda
-        start, limit, delta).astype(utils.numpy_dtype(
-            dtype or np.array(start).dtype)))
+    _range)
 
 rank = utils.copy_docstring(
     tf.rank,
-    lambda input, name=None: np.array(input).ndim)  # pylint: disable=redefined-builtin,g-long-lambda
+    lambda input, name=None: (  # pylint: disable=redefined-builtin,g-long-lambda
+        input.ndim if hasattr(input, 'ndim') else np.ndim(input)))
 
 reshape = utils.copy_docstring(
     tf.reshape,
@@ -312,9 +452,7 @@ transpose = utils.copy_docstring(
 
 unstack = utils.copy_docstring(
     tf.unstack,
-    lambda value, num=None, axis=0, name='unstack': tuple(  # pylint: disable=g-long-lambda
-        np.squeeze(x, axis=axis) for x in
-        np.split(value, value.shape[axis] if num is None else num, axis)))
+    _unstack)
 
 where = utils.copy_docstring(
     tf1.where,
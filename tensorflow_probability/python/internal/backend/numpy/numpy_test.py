@@ -145,6 +145,15 @@ def array_axis_tuples(draw, strategy=None, elements=None):
   return x, axis
 
 
+@hps.composite
+def array_and_reverse_axes(draw):
+  x = draw(single_arrays(shape=shapes(min_dims=1)))
+  rank = len(x.shape)
+  axes = draw(hps.lists(hps.integers(-rank, rank - 1), min_size=1,
+                        max_size=rank, unique_by=lambda ax: ax % rank))
+  return x, axes
+
+
 @hps.composite
 def sliceable_and_slices(draw, strategy=None):
   x = draw(strategy or single_arrays(shape=shapes(min_dims=1)))
@@ -157,6 +166,25 @@ def sliceable_and_slices(draw, strategy=None):
   return x, starts, sizes
 
 
+@hps.composite
+def gather_params(draw):
+  params = draw(single_arrays(shape=shapes(min_dims=1)))
+  rank = len(params.shape)
+  # `axis=None` gathers along the leading axis.
+  axis = draw(hps.one_of(hps.just(None), hps.integers(-rank, rank - 1)))
+  dim = params.shape[0 if axis is None else axis]
+  indices = draw(single_arrays(dtype=np.int32, shape=shapes(max_dims=2),
+                               elements=hps.integers(0, dim - 1)))
+  return params, indices, None, axis
+
+
+@hps.composite
+def meshgrid_args(draw):
+  n = draw(hps.integers(1, 3))
+  return tuple(draw(single_arrays(shape=shapes(min_dims=1, max_dims=1)))
+               for _ in range(n))
+
+
 @hps.composite
 def one_hot_params(draw):
   indices = draw(single_arrays(dtype=np.int32, elements=hps.integers(0, 8)))
@@ -598,8 +626,14 @@ NUMPY_TEST_CASES += [  # break the array for pylint to not timeout.
         assert_shape_only=True),
 
     # Array ops.
+    TestCase('gather', [gather_params()]),
+    TestCase('meshgrid', [meshgrid_args()]),
     TestCase('one_hot', [one_hot_params()]),
+    TestCase('reverse', [array_and_reverse_axes()]),
     TestCase('slice', [sliceable_and_slices()]),
+    TestCase('unstack', [
+        array_axis_tuples().map(lambda t: (t[0], None, t[1])),
+        array_axis_tuples().map(lambda t: (t[0], t[0].shape[t[1]], t[1]))]),
 ]
 
 
@@ -628,6 +662,59 @@ class NumpyTest(tfp_test_util.TestCase):
         np.int32,
         convert_to_tensor(np.int32(False), dtype_hint=tf.bool).dtype)
 
+  def test_meshgrid_kwargs(self):
+    meshgrid = numpy_backend.meshgrid
+    x, y = np.arange(3.), np.arange(2.)
+    for indexing in ('xy', 'ij'):
+      expected = np.meshgrid(x, y, indexing=indexing)
+      self.assertAllEqual(
+          expected, meshgrid(x, y, indexing=indexing, name='meshgrid'))
+      sparse = meshgrid(x, y, indexing=indexing, sparse=True)
+      self.assertEqual(x.size + y.size, sum(g.size for g in sparse))
+      self.assertAllEqual(expected, np.broadcast_arrays(*sparse))
+    with self.assertRaises(TypeError):
+      meshgrid(x, y, copy=True)
+
+  def test_one_hot(self):
+    one_hot = numpy_backend.one_hot
+    for dtype in (np.int8, np.uint8, np.int32):
+      self.assertAllEqual(
+          np.eye(300, dtype=np.float32)[:2],
+          one_hot(np.array([0, 1], dtype), 300, dtype=tf.float32))
+    self.assertEqual(np.float32, one_hot(np.array([0, 1]), 2).dtype)
+    self.assertEqual(
+        np.int32, one_hot(np.array([0, 1]), 2, on_value=np.int32(5)).dtype)
+    self.assertEqual(
+        np.float32, one_hot(np.array([0, 1]), 2, on_value=1.).dtype)
+    self.assertEqual(np.int32, one_hot(np.array([0, 1]), 2, off_value=3).dtype)
+
+  def test_range(self):
+    range_ = numpy_backend.range
+    self.assertAllClose(np.linspace(0., 4.5, 10), range_(0, 5, 0.5))
+    # Like `tf.range`, Python ints infer int32 and floats float32, and mixed
+    # arguments promote int32 < int64 < float32 < float64.
+    self.assertEqual(np.int32, range_(5).dtype)
+    self.assertEqual(np.float32, range_(0, 5, 0.5).dtype)
+    self.assertEqual(np.int64, range_(np.int64(0), 5).dtype)
+    self.assertEqual(np.float32, range_(np.float32(0), 2, 0.5).dtype)
+    self.assertEqual(np.float64, range_(np.float64(0), 2).dtype)
+    self.assertEqual(np.float32, range_(np.int64(0), 2, 0.5).dtype)
+    self.assertAllEqual([0., 1., 2.], range_(0, 3, dtype=tf.float32))
+
+  def test_reverse_invalid_axis(self):
+    x = np.zeros([2, 3, 4])
+    with self.assertRaises(ValueError):
+      numpy_backend.reverse(x, [3])
+    with self.assertRaises(ValueError):
+      numpy_backend.reverse(x, [1, -2])
+
+  def test_unstack_invalid_num(self):
+    x = np.zeros([2, 3])
+    with self.assertRaises(ValueError):
+      numpy_backend.unstack(x, num=1)
+    with self.assertRaises(ValueError):
+      numpy_backend.unstack(x, num=2, axis=1)
+
   def evaluate(self, tensors):
     if tf.executing_eagerly():
       return self._eval_helper(tensors)